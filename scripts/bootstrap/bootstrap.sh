@@ -259,7 +259,7 @@ clone_repository() {
     git clone "$REPO_URL" "$INSTALL_DIR"
     
     # Make scripts executable
-    find "$INSTALL_DIR/scripts" -name "*.sh" -type f -exec chmod +x {} \;
+    find "$INSTALL_DIR/scripts" -name "*.sh" -type f -exec chmod +x {} +
     
     log_success "Repository cloned to: $INSTALL_DIR"
 }
@@ -197,7 +197,7 @@ validate_profile() {
     
     # Validate YAML syntax
     if command -v python3 >/dev/null; then
-        if ! python3 -c "import yaml; yaml.safe_load(open('$profile_vars'))" 2>/dev/null; then
+        if ! python3 -c "import yaml; yaml.load(open('$profile_vars'), Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))" 2>/dev/null; then
             error "Invalid YAML syntax in profile configuration"
         fi
         log_success "YAML syntax valid"
@@ -159,12 +159,16 @@ check_services() {
     
     local critical_services=("NetworkManager" "sshd" "systemd-resolved" "systemd-timesyncd")
     
+    # List unit files once; every installed-unit check below reads this copy
+    local unit_files
+    unit_files=$(systemctl list-unit-files --no-legend --no-pager 2>/dev/null || true)
+    
     # Add desktop services if they exist
-    if systemctl list-unit-files | grep -q sddm; then
+    if grep -q sddm <<< "$unit_files"; then
         critical_services+=("sddm")
     fi
     
-    if systemctl list-unit-files | grep -q tlp; then
+    if grep -q tlp <<< "$unit_files"; then
         critical_services+=("tlp")
     fi
     
@@ -174,7 +178,7 @@ check_services() {
         elif systemctl is-enabled --quiet "$service" 2>/dev/null; then
             warn_health "Service $service is enabled but not running"
         else
-            if systemctl list-unit-files | grep -q "^$service"; then
+            if grep -q "^$service" <<< "$unit_files"; then
                 warn_health "Service $service is not enabled"
             else
                 info_health "Service $service not installed (optional)"
@@ -201,26 +205,47 @@ check_network() {
     info_health "Checking network connectivity..."
     
     # Check network interfaces
-    local interfaces
-    interfaces=$(ip link show | grep -E "^[0-9]+:" | awk -F': ' '{print $2}' | grep -v lo)
-    
+    # One-line output already carries each link's state, so the listing is
+    # read once rather than re-querying every interface it just returned
     info_health "Network interfaces:"
-    echo "$interfaces" | while read -r interface; do
-        if ip link show "$interface" | grep -q "state UP"; then
-            success_health "Interface $interface is UP"
-        else
-            warn_health "Interface $interface is DOWN"
-        fi
-    done
+    local interface state
+    while read -r interface state; do
+        case "$state" in
+            UP)
+                success_health "Interface $interface is UP"
+                ;;
+            DOWN|LOWERLAYERDOWN)
+                warn_health "Interface $interface is DOWN"
+                ;;
+            *)
+                # tun/WireGuard links report UNKNOWN while working normally
+                info_health "Interface $interface state: $state"
+                ;;
+        esac
+    done < <(ip -o link show | awk '{
+        name = $2; sub(/:$/, "", name); sub(/@.*/, "", name)
+        if (name == "lo") next
+        state = "UNKNOWN"
+        for (i = 3; i < NF; i++) if ($i == "state") { state = $(i + 1); break }
+        print name, state
+    }')
     
     # Check internet connectivity
-    if ping -c 1 -W 3 8.8.8.8 >/dev/null 2>&1; then
+    # Both probes are independent, so run them concurrently and collect
+    # their exit codes instead of paying the two timeouts back to back
+    local ping_ip_pid ping_dns_pid
+    ping -c 1 -W 3 8.8.8.8 >/dev/null 2>&1 &
+    ping_ip_pid=$!
+    ping -c 1 -W 3 archlinux.org >/dev/null 2>&1 &
+    ping_dns_pid=$!
+    
+    if wait "$ping_ip_pid"; then
         success_health "Internet connectivity (8.8.8.8)"
     else
         error_health "No internet connectivity"
     fi
     
-    if ping -c 1 -W 3 archlinux.org >/dev/null 2>&1; then
+    if wait "$ping_dns_pid"; then
         success_health "DNS resolution working (archlinux.org)"
     else
         warn_health "DNS resolution issues"
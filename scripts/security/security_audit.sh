@@ -22,16 +22,24 @@ header() {
     echo "=================================================================================" | tee -a "$REPORT_FILE"
 }
 
+# Running result counters, updated as each check reports
+total_pass=0
+total_fail=0
+total_warn=0
+
 check_status() {
     local status="$1"
     local message="$2"
     
     if [[ "$status" == "PASS" ]]; then
         echo "[SUCCESS] PASS: $message" | tee -a "$REPORT_FILE"
+        total_pass=$((total_pass + 1))
     elif [[ "$status" == "FAIL" ]]; then
         echo "[ERROR] FAIL: $message" | tee -a "$REPORT_FILE"
+        total_fail=$((total_fail + 1))
     elif [[ "$status" == "WARN" ]]; then
         echo "[WARNING]  WARN: $message" | tee -a "$REPORT_FILE"
+        total_warn=$((total_warn + 1))
     else
         echo "ℹ️  INFO: $message" | tee -a "$REPORT_FILE"
     fi
@@ -209,29 +217,31 @@ header "SUID/SGID AUDIT"
 
 # Check for unusual SUID/SGID files
 log_info "Checking for SUID/SGID files..."
-suid_count=$(find / -type f \( -perm -4000 -o -perm -2000 \) 2>/dev/null | wc -l)
+# Walk the filesystem once; %m is the octal mode so SUID entries can be
+# picked out of the same listing without a second traversal
+suid_sgid_files=$(find / -type f \( -perm -4000 -o -perm -2000 \) -printf '%m %p\n' 2>/dev/null || true)
+suid_count=$(printf '%s' "$suid_sgid_files" | grep -c '' || true)
 check_status "INFO" "Found $suid_count SUID/SGID files"
 
 # List unusual SUID files
-unusual_suid=$(find / -type f -perm -4000 2>/dev/null | grep -vE "(sudo|su|ping|mount|umount|passwd|chsh|chfn|newgrp|gpasswd)" || true)
+unusual_suid=$(printf '%s\n' "$suid_sgid_files" | awk '$1 >= 4000 { sub(/^[0-7]+ /, ""); print }' | grep -vE "(sudo|su|ping|mount|umount|passwd|chsh|chfn|newgrp|gpasswd)" || true)
 if [[ -n "${unusual_suid:-}" ]]; then
     check_status "WARN" "Unusual SUID files found:"
-    echo "$unusual_suid" | while read file; do
-        echo "  - $file" | tee -a "$REPORT_FILE"
-    done
+    sed 's/^/  - /' <<< "$unusual_suid" | tee -a "$REPORT_FILE"
 fi
 
 header "NETWORK SECURITY AUDIT"
 
 # Check listening services
 log_info "Checking listening services..."
-listening_services=$(netstat -tuln 2>/dev/null | grep LISTEN | wc -l)
+listening=$(netstat -tuln 2>/dev/null | grep LISTEN || true)
+listening_services=$(printf '%s' "$listening" | grep -c '' || true)
 check_status "INFO" "$listening_services services listening on network"
 
-# List all listening services
-netstat -tuln 2>/dev/null | grep LISTEN | while read line; do
-    echo "  $line" | tee -a "$REPORT_FILE"
-done
+# List all listening services from the same snapshot, in one write
+if [[ -n "$listening" ]]; then
+    sed 's/^/  /' <<< "$listening" | tee -a "$REPORT_FILE"
+fi
 
 # Check for promiscuous network interfaces
 log_info "Checking for promiscuous network interfaces..."
@@ -244,9 +254,17 @@ fi
 
 header "SYSTEM INTEGRITY AUDIT"
 
-# Check for world-writable files
-log_info "Checking for world-writable files..."
-world_writable=$(find / -type f -perm -002 2>/dev/null | grep -v "/proc/" | grep -v "/sys/" | wc -l)
+# Check for world-writable and orphaned files
+# Both checks share a single walk of the filesystem: find tags each hit
+# (W = world-writable, O = orphaned) and awk tallies the tags. /proc and
+# /sys are pruned rather than walked and filtered out afterwards
+log_info "Checking for world-writable and orphaned files..."
+read -r world_writable orphaned_files < <(
+    find / \( -path /proc -o -path /sys \) -prune -o \
+        \( \( -type f -perm -002 -printf 'W\n' \) , \( \( -nouser -o -nogroup \) -printf 'O\n' \) \) \
+        2>/dev/null |
+    awk '{ n[$1]++ } END { print n["W"] + 0, n["O"] + 0 }'
+)
 if [[ $world_writable -eq 0 ]]; then
     check_status "PASS" "No world-writable files found"
 else
@@ -254,8 +272,6 @@ else
 fi
 
 # Check for files without owner
-log_info "Checking for orphaned files..."
-orphaned_files=$(find / -nouser -o -nogroup 2>/dev/null | grep -v "/proc/" | grep -v "/sys/" | wc -l)
 if [[ $orphaned_files -eq 0 ]]; then
     check_status "PASS" "No orphaned files found"
 else
@@ -311,10 +327,6 @@ fi
 
 header "SUMMARY"
 
-total_pass=$(grep -c "[SUCCESS] PASS" "$REPORT_FILE")
-total_fail=$(grep -c "[ERROR] FAIL" "$REPORT_FILE")
-total_warn=$(grep -c "[WARNING]  WARN" "$REPORT_FILE")
-
 log_info "Security audit completed"
 log_info "Results: $total_pass PASS, $total_fail FAIL, $total_warn WARN"
 
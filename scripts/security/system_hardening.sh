@@ -262,7 +262,7 @@ chmod 755 /boot
 
 # Remove unnecessary SUID/SGID binaries
 log_info "Reviewing SUID/SGID binaries"
-find / -type f \( -perm -4000 -o -perm -2000 \) -exec ls -la {} \; 2>/dev/null | tee /tmp/suid_sgid_files.txt
+find / -type f \( -perm -4000 -o -perm -2000 \) -exec ls -la {} + 2>/dev/null | tee /tmp/suid_sgid_files.txt
 
 # Create security monitoring script
 cat > /usr/local/bin/security-monitor.sh << 'EOF'
@@ -86,8 +86,29 @@ test_package_manager() {
 test_essential_packages() {
     local essential_packages=("linux" "base" "systemd" "networkmanager")
     
+    # Resolve every package in one call: 'pacman -T' prints only the names
+    # no installed package satisfies (exit 127), so providers (e.g. foo-git)
+    # still count. Any other non-zero exit is a pacman error, not an answer,
+    # and every package is reported missing as if pacman were absent
+    local -A missing=()
+    local pkg unsatisfied rc=1
+    if command -v pacman >/dev/null 2>&1; then
+        rc=0
+        unsatisfied=$(pacman -T "${essential_packages[@]}" 2>/dev/null) || rc=$?
+    fi
+    
+    if [[ $rc -eq 0 || $rc -eq 127 ]]; then
+        while read -r pkg; do
+            [[ -n "$pkg" ]] && missing[$pkg]=1
+        done <<< "$unsatisfied"
+    else
+        for pkg in "${essential_packages[@]}"; do
+            missing[$pkg]=1
+        done
+    fi
+    
     for package in "${essential_packages[@]}"; do
-        if pacman -Q "$package" >/dev/null 2>&1; then
+        if [[ -z "${missing[$package]:-}" ]]; then
             log_test "Essential Package: $package" "PASS" "Package installed"
         else
             log_test "Essential Package: $package" "FAIL" "Package missing"
@@ -105,7 +105,7 @@ main() {
         echo "  - $VERBOSE_LOG"
         echo "  - $VM_VERBOSE_LOG" 
         echo "  - $STANDARD_LOG"
-        exit 1
+        return 1
     fi
     
     info "Analyzing log file: $log_file"
@@ -130,5 +130,7 @@ main() {
     info "To search for term: grep -i 'search_term' $log_file"
 }
 
-# Run main function
-main "$@"
\ No newline at end of file
+# Run main function only when executed, so the helpers can be sourced
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    main "$@"
+fi
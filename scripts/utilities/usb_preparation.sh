@@ -361,7 +361,7 @@ add_automation_files() {
         # Copy deployment scripts
         if [[ -d "$PROJECT_ROOT/scripts/deployment" ]]; then
             cp -r "$PROJECT_ROOT/scripts/deployment" "$automation_dir/"
-            find "$automation_dir/deployment" -name "*.sh" -exec chmod +x {} \;
+            find "$automation_dir/deployment" -name "*.sh" -exec chmod +x {} +
         fi
         
         # Copy configuration templates
@@ -129,7 +129,7 @@ validate_profile_config() {
     if [[ -f "$ansible_vars" ]]; then
         # Check YAML syntax
         if command_exists python3; then
-            if ! python3 -c "import yaml; yaml.safe_load(open('$ansible_vars'))" 2>/dev/null; then
+            if ! python3 -c "import yaml; yaml.load(open('$ansible_vars'), Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))" 2>/dev/null; then
                 validation_errors+=("Invalid YAML syntax in $ansible_vars")
             fi
         fi
@@ -247,7 +247,7 @@ list_backups() {
     # List directories
     while IFS= read -r -d '' backup_dir; do
         local timestamp
-        timestamp=$(basename "$backup_dir")
+        timestamp="${backup_dir##*/}"
         local size
         size=$(du -sh "$backup_dir" | cut -f1)
         
@@ -266,7 +266,7 @@ list_backups() {
     # List archive files
     while IFS= read -r -d '' archive_file; do
         local filename
-        filename=$(basename "$archive_file")
+        filename="${archive_file##*/}"
         local size
         size=$(du -sh "$archive_file" | cut -f1)
         echo "  $filename (archive, $size)"
@@ -374,7 +374,7 @@ restore_backup() {
     
     # If no specific items, restore all
     if [[ ${#restore_items[@]} -eq 0 ]]; then
-        restore_items=($(find "$backup_path" -name "*-backup.tar.gz" -exec basename {} \; | sed 's/-backup\.tar\.gz$//' 2>/dev/null || true))
+        restore_items=($(find "$backup_path" -name "*-backup.tar.gz" -printf '%f\n' | sed 's/-backup\.tar\.gz$//' 2>/dev/null || true))
     fi
     
     local success_count=0
@@ -466,13 +466,13 @@ cleanup_old_backups() {
     
     # Remove old directories
     find "$BACKUP_BASE_DIR" -maxdepth 1 -type d -name "20*" | sort | head -n -"$keep_count" | while read -r old_backup; do
-        log_info "Removing old backup: $(basename "$old_backup")"
+        log_info "Removing old backup: ${old_backup##*/}"
         rm -rf "$old_backup"
     done
     
     # Remove old archives
     find "$BACKUP_BASE_DIR" -maxdepth 1 -type f -name "backup-*.tar.gz" | sort | head -n -"$keep_count" | while read -r old_archive; do
-        log_info "Removing old archive: $(basename "$old_archive")"
+        log_info "Removing old archive: ${old_archive##*/}"
         rm -f "$old_archive"
     done
     
@@ -523,9 +523,9 @@ verify_backup() {
         ((total_files++))
         
         if tar -tzf "$backup_file" >/dev/null 2>&1; then
-            log_success "OK: $(basename "$backup_file")"
+            log_success "OK: ${backup_file##*/}"
         else
-            log_error "CORRUPT: $(basename "$backup_file")"
+            log_error "CORRUPT: ${backup_file##*/}"
             ((corrupt_files++))
         fi
     done < <(find "$backup_path" -name "*-backup.tar.gz" -print0 2>/dev/null)
@@ -45,12 +45,18 @@ check_cpu() {
     fi
     
     # Check CPU flags
-    cpu_flags=$(grep flags /proc/cpuinfo | head -1 | cut -d: -f2)
+    # Load the flags into a set once so each check is a lookup rather than
+    # a grep over the whole flag string
+    local -A cpu_flags=()
+    local cpu_flag
+    for cpu_flag in $(grep -m1 '^flags' /proc/cpuinfo | cut -d: -f2); do
+        cpu_flags[$cpu_flag]=1
+    done
     
     # Check for essential flags
     required_flags=("lm" "cmov" "cx8" "fpu" "fxsr" "mmx" "syscall" "sse2")
     for flag in "${required_flags[@]}"; do
-        if echo "$cpu_flags" | grep -q "$flag"; then
+        if [[ -n "${cpu_flags[$flag]:-}" ]]; then
             check_pass "CPU flag '$flag' supported"
         else
             check_fail "CPU flag '$flag' missing (required)"
@@ -60,7 +66,7 @@ check_cpu() {
     # Check for modern features
     modern_flags=("sse4_1" "sse4_2" "avx" "aes")
     for flag in "${modern_flags[@]}"; do
-        if echo "$cpu_flags" | grep -q "$flag"; then
+        if [[ -n "${cpu_flags[$flag]:-}" ]]; then
             check_pass "CPU flag '$flag' supported (performance benefit)"
         else
             check_warn "CPU flag '$flag' not available (may impact performance)"
@@ -345,8 +351,12 @@ check_wayland_requirements() {
         "libxkbcommon.so"
     )
     
+    # Read the linker cache once instead of once per library
+    local ld_cache
+    ld_cache=$(ldconfig -p 2>/dev/null || true)
+    
     for lib in "${wayland_libs[@]}"; do
-        if ldconfig -p | grep -q "$lib"; then
+        if [[ "$ld_cache" == *"$lib"* ]]; then
             check_pass "Wayland library available: $lib"
         else
             check_warn "Wayland library missing: $lib (will be installed)"
@@ -376,10 +386,14 @@ check_wayland_requirements() {
 generate_summary() {
     echo -e "\n${BLUE}=== HARDWARE COMPATIBILITY SUMMARY ===${NC}" | tee -a "$REPORT_FILE"
     
-    # Count results
-    pass_count=$(grep -c "[OK] PASS" "$REPORT_FILE" || echo 0)
-    warn_count=$(grep -c "⚠ WARN" "$REPORT_FILE" || echo 0)
-    fail_count=$(grep -c "[FAIL] FAIL" "$REPORT_FILE" || echo 0)
+    # Count results in a single pass over the report; index() matches the
+    # markers literally, so the brackets are not read as regex classes
+    read -r pass_count warn_count fail_count < <(awk '
+        index($0, "[OK] PASS") { p++ }
+        index($0, "⚠ WARN") { w++ }
+        index($0, "[FAIL] FAIL") { f++ }
+        END { print p + 0, w + 0, f + 0 }
+    ' "$REPORT_FILE")
     
     echo "Results:"
     echo -e "  ${GREEN}[OK] PASS: $pass_count${NC}"